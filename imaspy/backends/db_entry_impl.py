@@ -3,7 +3,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy
 
@@ -78,6 +78,7 @@ class DBEntryImpl(ABC):
         destination: IDSToplevel,
         lazy: bool,
         nbc_map: Optional[NBCPathMap],
+        time_mode: Optional[int],
     ) -> None:
         """Implement DBEntry.get/get_slice/get_sample. Load data from the data source.
 
@@ -89,14 +90,23 @@ class DBEntryImpl(ABC):
             lazy: Use lazy loading.
             nbc_map: NBCPathMap to use for implicit conversion. When None, no implicit
                 conversion needs to be done.
+            time_mode: Time mode of the stored IDS, as returned by
+                :meth:`read_dd_version`.
         """
 
     @abstractmethod
-    def read_dd_version(self, ids_name: str, occurrence: int) -> str:
+    def read_dd_version(
+        self, ids_name: str, occurrence: int
+    ) -> Tuple[str, Optional[int]]:
         """Read data dictionary version that the requested IDS was stored with.
 
         This method should raise a DataEntryException if the specified ids/occurrence is
         not filled.
+
+        Returns:
+            Tuple with the data dictionary version and the time mode
+            (``ids_properties/homogeneous_time``) of the stored IDS. The time mode may
+            be None when the backend doesn't need it in :meth:`get`.
         """
 
     @abstractmethod
@@ -162,7 +162,7 @@ class ALContext:
         """Call ual_write_data with this context."""
         status = ll_interface.write_data(self.ctx, path, timebasepath, data)
         if status != 0:
-            raise LowlevelError(f"write data at {path!r}: {status=}")
+            raise LowlevelError(f"write data at {path!r}", status)
 
     def list_all_occurrences(self, ids_name: str) -> List[int]:
         """List all occurrences of this IDS."""
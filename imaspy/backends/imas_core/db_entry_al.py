@@ -5,7 +5,7 @@ import getpass
 import logging
 import os
 from collections import deque
-from typing import Any, Deque, List, Optional, Union
+from typing import Any, Deque, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from imaspy.backends.db_entry_impl import GetSampleParameters, GetSliceParameters
@@ -68,6 +68,14 @@ def require_imas_available():
         )
 
 
+def _ll_path(ids_name: str, occurrence: int) -> str:
+    """Lowlevel path of an IDS occurrence, e.g. ``core_profiles/1``.
+
+    Occurrence 0 is stored without suffix.
+    """
+    return f"{ids_name}/{occurrence}" if occurrence != 0 else ids_name
+
+
 class ALDBEntryImpl(DBEntryImpl):
     """DBEntry implementation using imas_core as a backend."""
 
@@ -243,6 +251,7 @@ class ALDBEntryImpl(DBEntryImpl):
         destination: IDSToplevel,
         lazy: bool,
         nbc_map: Optional[NBCPathMap],
+        time_mode: Optional[int],
     ) -> None:
         if self._db_ctx is None:
             raise RuntimeError("Database entry is not open.")
@@ -252,15 +261,15 @@ class ALDBEntryImpl(DBEntryImpl):
         # Mixing contexts can be problematic, ensure all lazy contexts are closed:
         self._clear_lazy_ctx_cache()
 
-        ll_path = ids_name
-        if occurrence != 0:
-            ll_path += f"/{occurrence}"
+        ll_path = _ll_path(ids_name, occurrence)
 
-        with self._db_ctx.global_action(ll_path, READ_OP) as read_ctx:
-            time_mode_path = "ids_properties/homogeneous_time"
-            time_mode = read_ctx.read_data(time_mode_path, "", INTEGER_DATA, 0)
-            # This is already checked by read_dd_version, but ensure:
-            assert time_mode in IDS_TIME_MODES
+        # The time mode is read together with the DD version in read_dd_version, which
+        # already checked it. Only read it when the caller didn't provide it.
+        if time_mode is None:
+            with self._db_ctx.global_action(ll_path, READ_OP) as read_ctx:
+                time_mode_path = "ids_properties/homogeneous_time"
+                time_mode = read_ctx.read_data(time_mode_path, "", INTEGER_DATA, 0)
+        assert time_mode in IDS_TIME_MODES
 
         if lazy:
             context = LazyALContext(dbentry=self, nbc_map=nbc_map, time_mode=time_mode)
@@ -303,15 +312,13 @@ class ALDBEntryImpl(DBEntryImpl):
 
         return destination
 
-    def read_dd_version(self, ids_name: str, occurrence: int) -> str:
+    def read_dd_version(self, ids_name: str, occurrence: int) -> Tuple[str, int]:
         if self._db_ctx is None:
             raise RuntimeError("Database entry is not open.")
         # Mixing contexts can be problematic, ensure all lazy contexts are closed:
         self._clear_lazy_ctx_cache()
 
-        ll_path = ids_name
-        if occurrence != 0:
-            ll_path += f"/{occurrence}"
+        ll_path = _ll_path(ids_name, occurrence)
 
         with self._db_ctx.global_action(ll_path, READ_OP) as read_ctx:
             time_mode_path = "ids_properties/homogeneous_time"
@@ -323,7 +330,7 @@ class ALDBEntryImpl(DBEntryImpl):
             raise DataEntryException(
                 f"IDS {ids_name!r}, occurrence {occurrence} is empty."
             )
-        return dd_version
+        return dd_version, time_mode
 
     def put(self, ids: IDSToplevel, occurrence: int, is_slice: bool) -> None:
         if self._db_ctx is None:
@@ -341,11 +348,10 @@ class ALDBEntryImpl(DBEntryImpl):
             )
             nbc_map = ddmap.old_to_new if source_is_older else ddmap.new_to_old
 
-        ll_path = ids_name
-        if occurrence != 0:
-            ll_path += f"/{occurrence}"
+        ll_path = _ll_path(ids_name, occurrence)
 
-        time_mode = ids.ids_properties.homogeneous_time
+        # Use the plain int: put_children compares time_mode for every (nested) AoS
+        time_mode = ids.ids_properties.homogeneous_time.value
         if is_slice:
             with self._db_ctx.global_action(ll_path, READ_OP) as read_ctx:
                 db_time_mode = read_ctx.read_data(
@@ -385,12 +391,10 @@ class ALDBEntryImpl(DBEntryImpl):
         # Mixing contexts can be problematic, ensure all lazy contexts are closed:
         self._clear_lazy_ctx_cache()
 
-        ll_path = ids_name
-        if occurrence != 0:
-            ll_path += f"/{occurrence}"
+        ll_path = _ll_path(ids_name, occurrence)
         ids = self._ids_factory.new(ids_name)
         with self._db_ctx.global_action(ll_path, WRITE_OP) as write_ctx:
-            delete_children(ids.metadata, write_ctx, "")
+            delete_children(ids.metadata, write_ctx)
 
     def list_all_occurrences(self, ids_name: str) -> List[int]:
         try:
@@ -3,7 +3,8 @@
 """Helper methods for loading data from and storing data to Data Entries.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -12,7 +13,6 @@ from imaspy.ids_convert import NBCPathMap
 from imaspy.ids_data_type import IDSDataType
 from imaspy.ids_defs import IDS_TIME_MODE_HOMOGENEOUS, IDS_TIME_MODE_INDEPENDENT
 from imaspy.ids_metadata import IDSMetadata
-from imaspy.ids_struct_array import IDSStructArray
 from imaspy.ids_structure import IDSStructure
 
 from .al_context import ALContext, LazyALContext
@@ -28,53 +28,67 @@ def get_children(
     # NOTE: changes in this method must be propagated to _get_child and vice versa
     #   Performance: this method is specialized for the non-lazy get
 
-    for name, child_meta in structure._children.items():
-        if time_mode == IDS_TIME_MODE_INDEPENDENT and child_meta.type.is_dynamic:
-            continue  # skip dynamic (time-dependent) nodes
-
-        path = child_meta.path_string
-        data_type = child_meta.data_type
-
-        if nbc_map and path in nbc_map:
-            if nbc_map.path[path] is None:
-                continue  # element does not exist in the on-disk DD version
-            new_path = nbc_map.ctxpath[path]
-            timebase = nbc_map.tbp[path]
-        elif nbc_map and path in nbc_map.type_change:
-            continue  # we don't handle type changes when converting implicitly
+    # Loop invariants
+    skip_dynamic = time_mode == IDS_TIME_MODE_INDEPENDENT
+    homogeneous_time = time_mode == IDS_TIME_MODE_HOMOGENEOUS
+    read_data = ctx.read_data
+
+    # Nested structures share the AL context of their parent. Instead of recursing
+    # into them, we keep a stack of (structure, children iterator) and descend
+    # in-place. Only arrays of structures (which need a new AL context) recurse.
+    stack = [(structure, iter(structure._children.items()))]
+    while stack:
+        structure, children = stack[-1]
+        for name, child_meta in children:
+            if skip_dynamic and child_meta.type.is_dynamic:
+                continue  # skip dynamic (time-dependent) nodes
+
+            path = child_meta.path_string
+            data_type = child_meta.data_type
+
+            if nbc_map and path in nbc_map:
+                if nbc_map.path[path] is None:
+                    continue  # element does not exist in the on-disk DD version
+                new_path = nbc_map.ctxpath[path]
+                timebase = nbc_map.tbp[path]
+            elif nbc_map and path in nbc_map.type_change:
+                continue  # we don't handle type changes when converting implicitly
+            else:
+                new_path = child_meta._ctx_path
+                timebase = child_meta.timebasepath
+
+            # Override time base for homogeneous time
+            if timebase and homogeneous_time:
+                timebase = "/time"
+
+            if data_type is IDSDataType.STRUCT_ARRAY:
+                # Regular get/get_slice:
+                with ctx.arraystruct_action(new_path, timebase, 0) as (new_ctx, size):
+                    if size > 0:
+                        element = getattr(structure, name)
+                        element.resize(size)
+                        for item in element:
+                            get_children(item, new_ctx, time_mode, nbc_map)
+                            new_ctx.iterate_over_arraystruct(1)
+
+            elif data_type is IDSDataType.STRUCTURE:
+                element = getattr(structure, name)
+                stack.append((element, iter(element._children.items())))
+                break  # continue with the children of element
+
+            else:  # Data elements
+                ndim = child_meta._al_ndim
+                data = read_data(new_path, timebase, data_type.al_type, ndim)
+                if not (
+                    # Empty arrays and STR_1D
+                    data is None
+                    # EMPTY_INT, EMPTY_FLOAT, EMPTY_COMPLEX, empty string
+                    or (child_meta.ndim == 0 and data == data_type.default)
+                ):
+                    # NOTE: bypassing IDSPrimitive.value.setter logic
+                    getattr(structure, name)._IDSPrimitive__value = data
         else:
-            new_path = child_meta._ctx_path
-            timebase = child_meta.timebasepath
-
-        # Override time base for homogeneous time
-        if timebase and time_mode == IDS_TIME_MODE_HOMOGENEOUS:
-            timebase = "/time"
-
-        if data_type is IDSDataType.STRUCT_ARRAY:
-            # Regular get/get_slice:
-            with ctx.arraystruct_action(new_path, timebase, 0) as (new_ctx, size):
-                if size > 0:
-                    element = getattr(structure, name)
-                    element.resize(size)
-                    for item in element:
-                        get_children(item, new_ctx, time_mode, nbc_map)
-                        new_ctx.iterate_over_arraystruct(1)
-
-        elif data_type is IDSDataType.STRUCTURE:
-            element = getattr(structure, name)
-            get_children(element, ctx, time_mode, nbc_map)
-
-        else:  # Data elements
-            ndim = child_meta._al_ndim
-            data = ctx.read_data(new_path, timebase, data_type.al_type, ndim)
-            if not (
-                # Empty arrays and STR_1D
-                data is None
-                # EMPTY_INT, EMPTY_FLOAT, EMPTY_COMPLEX, empty string
-                or (child_meta.ndim == 0 and data == data_type.default)
-            ):
-                # NOTE: bypassing IDSPrimitive.value.setter logic
-                getattr(structure, name)._IDSPrimitive__value = data
+            stack.pop()  # all children of this structure are processed
 
 
 def _get_child(child: IDSBase, ctx: Optional[LazyALContext]):
@@ -136,11 +150,30 @@ def _get_child(child: IDSBase, ctx: Optional[LazyALContext]):
 
 def delete_children(structure: IDSMetadata, ctx: ALContext) -> None:
     """Recursively delete all children of an IDSStructure"""
-    for child_meta in structure._children.values():
-        if child_meta.data_type is IDSDataType.STRUCTURE:
-            delete_children(child_meta, ctx)
+    # The lowlevel has no call to delete multiple paths at once, but the list of
+    # paths only depends on the metadata and is cached:
+    delete_data = ctx.delete_data
+    for path in _delete_paths(structure):
+        delete_data(path)
+
+
+@lru_cache(maxsize=256)
+def _delete_paths(structure: IDSMetadata) -> Tuple[str, ...]:
+    """Get the context paths of all nodes that delete_children needs to delete.
+
+    Sub-structures are traversed, data nodes and arrays of structures are deleted.
+    """
+    paths = []
+    stack = [iter(structure._children.values())]
+    while stack:
+        for child_meta in stack[-1]:
+            if child_meta.data_type is IDSDataType.STRUCTURE:
+                stack.append(iter(child_meta._children.values()))
+                break  # continue with the children of child_meta
+            paths.append(child_meta._ctx_path)
         else:
-            ctx.delete_data(child_meta._ctx_path)
+            stack.pop()
+    return tuple(paths)
 
 
 def put_children(
@@ -155,46 +188,59 @@ def put_children(
     # Note: when putting a slice, we do not need to descend into IDSStructure and
     # IDSStructArray elements if they don't contain dynamic data nodes. That is hard to
     # detect now, so we just recurse and check the data elements
-    for element in structure.iter_nonempty_():
-        if time_mode == IDS_TIME_MODE_INDEPENDENT and element.metadata.type.is_dynamic:
-            continue  # skip dynamic data when in time independent mode
-
-        path = element.metadata.path_string
-        if nbc_map and path in nbc_map:
-            if nbc_map.path[path] is None:
-                continue  # element does not exist in the on-disk DD version
-            new_path = nbc_map.ctxpath[path]
-            timebase = nbc_map.tbp[path]
-        elif nbc_map and path in nbc_map.type_change:
-            continue  # we don't handle type changes when converting implicitly
+
+    # Nested structures share the AL context of their parent: descend in-place with a
+    # stack of iterators (see get_children), only arrays of structures recurse.
+    skip_dynamic = time_mode == IDS_TIME_MODE_INDEPENDENT
+    homogeneous_time = time_mode == IDS_TIME_MODE_HOMOGENEOUS
+    write_data = ctx.write_data
+    stack = [structure.iter_nonempty_()]
+    while stack:
+        for element in stack[-1]:
+            metadata = element.metadata
+            if skip_dynamic and metadata.type.is_dynamic:
+                continue  # skip dynamic data when in time independent mode
+
+            path = metadata.path_string
+            if nbc_map and path in nbc_map:
+                if nbc_map.path[path] is None:
+                    continue  # element does not exist in the on-disk DD version
+                new_path = nbc_map.ctxpath[path]
+                timebase = nbc_map.tbp[path]
+            elif nbc_map and path in nbc_map.type_change:
+                continue  # we don't handle type changes when converting implicitly
+            else:
+                new_path = metadata._ctx_path
+                timebase = metadata.timebasepath
+
+            # Override time base for homogeneous time
+            if timebase and homogeneous_time:
+                timebase = "/time"
+
+            data_type = metadata.data_type
+            if data_type is IDSDataType.STRUCT_ARRAY:
+                size = len(element)
+                if verify_maxoccur:
+                    maxoccur = metadata.maxoccur
+                    if maxoccur and size > maxoccur:
+                        raise RuntimeError(
+                            f"Exceeding maximum number of occurrences ({maxoccur}) "
+                            f"of {element._path}"
+                        )
+                with ctx.arraystruct_action(new_path, timebase, size) as (new_ctx, _):
+                    for item in element:
+                        put_children(
+                            item, new_ctx, time_mode, is_slice, nbc_map, verify_maxoccur
+                        )
+                        new_ctx.iterate_over_arraystruct(1)
+
+            elif data_type is IDSDataType.STRUCTURE:
+                stack.append(element.iter_nonempty_())
+                break  # continue with the children of element
+
+            else:  # Data elements
+                if is_slice and not metadata.type.is_dynamic:
+                    continue  # put_slice only stores dynamic data
+                write_data(new_path, timebase, element.value)
         else:
-            new_path = element.metadata._ctx_path
-            timebase = element.metadata.timebasepath
-
-        # Override time base for homogeneous time
-        if timebase and time_mode == IDS_TIME_MODE_HOMOGENEOUS:
-            timebase = "/time"
-
-        if isinstance(element, IDSStructArray):
-            size = len(element)
-            if verify_maxoccur:
-                maxoccur = element.metadata.maxoccur
-                if maxoccur and size > maxoccur:
-                    raise RuntimeError(
-                        f"Exceeding maximum number of occurrences ({maxoccur}) "
-                        f"of {element._path}"
-                    )
-            with ctx.arraystruct_action(new_path, timebase, size) as (new_ctx, _):
-                for item in element:
-                    put_children(
-                        item, new_ctx, time_mode, is_slice, nbc_map, verify_maxoccur
-                    )
-                    new_ctx.iterate_over_arraystruct(1)
-
-        elif isinstance(element, IDSStructure):
-            put_children(element, ctx, time_mode, is_slice, nbc_map, verify_maxoccur)
-
-        else:  # Data elements
-            if is_slice and not element.metadata.type.is_dynamic:
-                continue  # put_slice only stores dynamic data
-            ctx.write_data(new_path, timebase, element.value)
+            stack.pop()  # all children of this structure are processed
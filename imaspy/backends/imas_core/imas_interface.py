@@ -15,6 +15,8 @@ from packaging.version import Version
 
 logger = logging.getLogger(__name__)
 
+_AL_VERSION_5 = Version("5")
+
 
 # Import the Access Layer module
 has_imas = True
@@ -87,7 +89,7 @@ class LowlevelInterface:
         self._lowlevel = lowlevel
         self._al_version = None
         self._al_version_str = ""
-        public_methods = [attr for attr in dir(self) if not attr.startswith("_")]
+        public_methods = list(_PUBLIC_METHODS)
 
         # AL not available
         if self._lowlevel is None:
@@ -111,7 +113,7 @@ class LowlevelInterface:
             self._al_version = Version("4")
             public_methods.remove("close_pulse")
 
-        if self._al_version < Version("5"):
+        if self._al_version < _AL_VERSION_5:
             method_prefix = "ual_"
         else:
             method_prefix = "al_"
@@ -223,10 +225,17 @@ class LowlevelInterface:
         raise self._minimal_version("5.4")
 
 
+# Public methods of the interface, fixed once the class is defined
+_PUBLIC_METHODS = tuple(
+    name
+    for name, func in vars(LowlevelInterface).items()
+    if not name.startswith("_") and inspect.isfunction(func)
+)
+
 # Dummy documentation for interface:
-for funcname in dir(LowlevelInterface):
+for funcname in _PUBLIC_METHODS:
     func = getattr(LowlevelInterface, funcname)
-    if not funcname.startswith("_") and inspect.isfunction(func) and not func.__doc__:
+    if not func.__doc__:
         func.__doc__ = f"Wrapper function for AL lowlevel method ``{funcname}``"
 
 ll_interface = LowlevelInterface(lowlevel)
@@ -1,7 +1,7 @@
 """DBEntry implementation using NetCDF as a backend."""
 
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from imaspy.backends.db_entry_impl import (
     DBEntryImpl,
@@ -92,6 +92,7 @@ class NCDBEntryImpl(DBEntryImpl):
         destination: IDSToplevel,
         lazy: bool,
         nbc_map: Optional[NBCPathMap],
+        time_mode: Optional[int],
     ) -> None:
         # Feature compatibility checks
         if parameters is not None:
@@ -126,8 +127,11 @@ class NCDBEntryImpl(DBEntryImpl):
 
         return destination
 
-    def read_dd_version(self, ids_name: str, occurrence: int) -> str:
-        return self._ds_factory.version  # All IDSs must be stored in this DD version
+    def read_dd_version(
+        self, ids_name: str, occurrence: int
+    ) -> Tuple[str, Optional[int]]:
+        # All IDSs must be stored in this DD version. The time mode is not needed in get
+        return self._ds_factory.version, None
 
     def put(self, ids: IDSToplevel, occurrence: int, is_slice: bool) -> None:
         if is_slice:
@@ -101,7 +101,7 @@ def analyze_db(dbentry: Iterable[Path], output: Path) -> None:
     if data:
         with gzip.open(output, "wt", encoding="utf-8") as file:
             json.dump(data, file)
-        logger.info(f"Output data is stored in {output}")
+        logger.info("Output data is stored in %s", output)
 
 
 def analyze_folder(entry: Path):
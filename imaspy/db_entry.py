@@ -563,7 +563,7 @@ class DBEntry:
             raise IDSNameError(ids_name, self._ids_factory)
 
         # Note: this will raise an exception when the ids/occurrence is not filled:
-        dd_version = self._dbe_impl.read_dd_version(ids_name, occurrence)
+        dd_version, time_mode = self._dbe_impl.read_dd_version(ids_name, occurrence)
 
         # DD version sanity checks:
         if not dd_version:
@@ -625,6 +625,7 @@ class DBEntry:
             destination,
             lazy,
             nbc_map,
+            time_mode,
         )
 
     def put(self, ids: IDSToplevel, occurrence: int = 0) -> None:
@@ -194,14 +194,14 @@ def get_data_dictionary_repo() -> Tuple[bool, bool]:
         repo = git.Repo(dd_repo_path)
     except git.exc.InvalidGitRepositoryError:
         repo = git.Repo.init(dd_repo_path)
-    logger.info("Set up local git repository {!s}".format(repo))
+    logger.info("Set up local git repository %s", repo)
 
     try:
         origin = repo.remote()
     except ValueError:
         dd_repo_url = "ssh://git@git.iter.org/imas/data-dictionary.git"
         origin = repo.create_remote("origin", url=dd_repo_url)
-    logger.info("Set up remote '{!s}' linking to '{!s}'".format(origin, origin.url))
+    logger.info("Set up remote '%s' linking to '%s'", origin, origin.url)
 
     try:
         origin.fetch(tags=True)
@@ -274,7 +274,7 @@ def build_data_dictionary(repo, tag: str, saxon_jar_path: str, rebuild=False) ->
     result_xml = _build_dir / f"{tag}.xml"
 
     if result_xml.exists() and not rebuild:
-        logger.debug(f"XML for tag '{tag}' already exists, skipping")
+        logger.debug("XML for tag '%s' already exists, skipping", tag)
         return
 
     repo.git.checkout(tag, force=True)
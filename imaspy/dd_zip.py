@@ -86,7 +86,10 @@ def _generate_zipfile_locations() -> Iterator[Union[Path, Traversable]]:
     yield files(imaspy) / "assets" / zip_name
 
 
+@lru_cache
 def parse_dd_version(version: str) -> Version:
+    # Cached: Version objects are immutable and parsing the version string is
+    # relatively expensive
     try:
         return Version(version)
     except InvalidVersion:
@@ -278,12 +278,13 @@ class DDVersionMap:
                 elif self._check_data_type(old_item, new_item):
                     add_rename(old_path, new_path)
                     if old_item.get("data_type") in DDVersionMap.STRUCTURE_TYPES:
-                        # Add entries for common sub-elements
-                        for path in old_paths:
-                            if path.startswith(old_path):
-                                npath = path.replace(old_path, new_path, 1)
-                                if npath in new_path_set:
-                                    add_rename(path, npath)
+                        # Add entries for common sub-elements. Only visit the subtree
+                        # of old_item instead of checking every path in the IDS.
+                        for old_field in old_item.iter("field"):
+                            path = old_field.get("path", "")
+                            npath = path.replace(old_path, new_path, 1)
+                            if npath in new_path_set:
+                                add_rename(path, npath)
             elif nbc_description == "type_changed":
                 pass  # We will handle this (if possible) in self._check_data_type
             elif nbc_description == "repeat_children_first_point":
@@ -48,6 +48,7 @@ class IDSCoordinate:
     """
 
     _cache: Dict[str, "IDSCoordinate"] = {}
+    _init_done = False  # Set to True at the end of __init__
 
     def __new__(cls, coordinate_spec: str) -> "IDSCoordinate":
         if coordinate_spec not in cls._cache:
@@ -55,7 +56,7 @@ class IDSCoordinate:
         return cls._cache[coordinate_spec]
 
     def __init__(self, coordinate_spec: str) -> None:
-        if hasattr(self, "_init_done"):
+        if self._init_done:
             return  # Already initialized, __new__ returned from cache
         self._coordinate_spec = coordinate_spec
         self.size: Optional[int] = None
@@ -70,7 +71,8 @@ class IDSCoordinate:
                         self.size = int(spec[4:])
                     except ValueError:
                         logger.debug(
-                            f"Ignoring invalid coordinate specifier {spec}",
+                            "Ignoring invalid coordinate specifier %s",
+                            spec,
                             exc_info=True,
                         )
             elif spec.startswith("IDS:"):
@@ -80,7 +82,7 @@ class IDSCoordinate:
                     refs.append(IDSPath(spec))
                 except ValueError:
                     logger.debug(
-                        f"Ignoring invalid coordinate specifier {spec}", exc_info=True
+                        "Ignoring invalid coordinate specifier %s", spec, exc_info=True
                     )
         self.references: "tuple[IDSPath]" = tuple(refs)
         """A tuple paths that this coordinate refers to.
@@ -98,7 +100,7 @@ class IDSCoordinate:
         self._init_done = True
 
     def __setattr__(self, name: str, value: Any):
-        if hasattr(self, "_init_done"):
+        if self._init_done:
             raise RuntimeError("Cannot set attribute: IDSCoordinate is read-only.")
         super().__setattr__(name, value)
 
@@ -187,7 +189,7 @@ class IDSCoordinates:
         coordinate_path: Optional[IDSPath] = None
         # Time is a special coordinate:
         if coordinate.is_time_coordinate:
-            time_mode = self._node._time_mode
+            time_mode = self._node._time_mode.value
             if time_mode == HOMOGENEOUS_TIME:
                 coordinate_path = IDSPath("time")
             elif time_mode == HETEROGENEOUS_TIME:
@@ -5,7 +5,9 @@
 
 import logging
 from functools import partial
-from typing import Any, Iterable, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from weakref import WeakKeyDictionary
+from xml.etree.ElementTree import Element, ElementTree
 
 from imaspy import dd_zip
 from imaspy.exception import IDSNameError
@@ -14,6 +16,26 @@ from imaspy.ids_toplevel import IDSToplevel
 logger = logging.getLogger(__name__)
 
 
+_ids_elements_cache: WeakKeyDictionary = WeakKeyDictionary()
+"""IDS name index per DD element tree, dropped together with the element tree."""
+
+
+def _ids_elements(etree: ElementTree) -> Dict[str, Element]:
+    """Map IDS names to their XML elements, built once per DD element tree.
+
+    The returned dictionary is shared between IDSFactory instances and must not be
+    modified.
+    """
+    elements = _ids_elements_cache.get(etree)
+    if elements is None:
+        elements = _ids_elements_cache[etree] = _build_ids_elements(etree)
+    return elements
+
+
+def _build_ids_elements(etree: ElementTree) -> Dict[str, Element]:
+    return {ele.get("name"): ele for ele in etree.findall("IDS")}
+
+
 class IDSFactory:
     """Factory class generating IDSToplevel elements for specific DD versions.
 
@@ -40,9 +62,7 @@ class IDSFactory:
         """
         self._xml_path = xml_path
         self._etree = dd_zip.dd_etree(version, xml_path)
-        self._ids_elements = {
-            ele.get("name"): ele for ele in self._etree.findall("IDS")
-        }
+        self._ids_elements = _ids_elements(self._etree)
 
         version_element = self._etree.find("version")
         if version_element is not None:
@@ -3,6 +3,8 @@
 """Core of the IMASPy interpreted IDS metadata
 """
 import re
+import sys
+import threading
 import types
 from enum import Enum
 from functools import lru_cache
@@ -50,6 +52,23 @@ class IDSType(Enum):
         self.is_dynamic = name == "dynamic"
 
 
+def get_toplevel_metadata(structure_xml: Element) -> "IDSMetadata":
+    """Build metadata tree of an IDS toplevel element.
+
+    Args:
+        structure_xml: XML element belonging to an IDS toplevel (e.g. core_profiles).
+    """
+    # Look up and build under a single lock: concurrent callers wait for the metadata
+    # to be built once, and only fully built metadata ends up in (and is returned
+    # from) the cache.
+    with _metadata_build_lock:
+        return _get_toplevel_metadata(structure_xml)
+
+
+_metadata_build_lock = threading.Lock()
+"""Lock serializing :func:`get_toplevel_metadata`."""
+
+
 # This cache is for IDSMetadata for IDS toplevels
 # Typical use case is one or two DD versions
 # Currently the DD has ~70 unique IDSs, so this cache has plenty of size to store all
@@ -58,16 +77,14 @@ class IDSType(Enum):
 # Perhaps the cache could be smaller, but that would be less efficient for the unit
 # tests...
 @lru_cache(maxsize=256)
-def get_toplevel_metadata(structure_xml: Element) -> "IDSMetadata":
-    """Build metadata tree of an IDS toplevel element.
-
-    Args:
-        structure_xml: XML element belonging to an IDS toplevel (e.g. core_profiles).
-    """
+def _get_toplevel_metadata(structure_xml: Element) -> "IDSMetadata":
+    """Build toplevel metadata, see :func:`get_toplevel_metadata`."""
     if not _type_map:
         _build_type_map()
 
-    # Delete the custom __setattr__ so __init__ can assign values:
+    # Delete the custom __setattr__ so __init__ can assign values. This is much
+    # cheaper than checking an "init done" flag in __setattr__ for every attribute of
+    # every node.
     orig_setattr = IDSMetadata.__setattr__
     del IDSMetadata.__setattr__
     try:
@@ -112,6 +129,47 @@ def _build_type_map():
         _type_map[(IDSDataType.CPX, dim)] = IDSNumericArray
 
 
+_COORDINATE_ATTRIBUTES = tuple(f"coordinate{dim}" for dim in range(1, 7))
+"""Names of the coordinate attributes in the DD XML, for all dimensions."""
+
+
+@lru_cache(maxsize=None)
+def _parse_coordinates(
+    coordinate_specs: Tuple[Tuple[Optional[str], Optional[str]], ...],
+) -> Tuple[Tuple[IDSCoordinate, ...], Tuple[IDSCoordinate, ...]]:
+    """Parse coordinate specifications from the DD XML.
+
+    The result is cached, so DD nodes with identical coordinate attributes share the
+    same (immutable) coordinate tuples.
+
+    Args:
+        coordinate_specs: Tuple with, for each dimension, a tuple of the
+            ``coordinateN`` and ``coordinateN_same_as`` attributes (or None when the
+            attribute is not present).
+
+    Returns:
+        Tuple of ``coordinates`` and ``coordinates_same_as``.
+    """
+    empty = IDSCoordinate("")
+    coors = tuple(
+        IDSCoordinate(coor) if coor else empty for coor, _ in coordinate_specs
+    )
+    coors_same_as = tuple(
+        IDSCoordinate(same_as) if same_as else empty for _, same_as in coordinate_specs
+    )
+    return coors, coors_same_as
+
+
+@lru_cache(maxsize=None)
+def _parse_alternative_coordinates(spec: str) -> Tuple[IDSPath, ...]:
+    """Parse the ``alternative_coordinate1`` attribute from the DD XML.
+
+    Like :func:`_parse_coordinates`, the result is cached so DD nodes with the same
+    alternative coordinates share one tuple.
+    """
+    return tuple(IDSPath(coor) for coor in spec.split(";"))
+
+
 class IDSMetadata:
     """Container for IDS Metadata stored in the Data Dictionary.
 
@@ -143,7 +201,10 @@ class IDSMetadata:
         self._parent = parent_meta
 
         # Mandatory attributes
-        self.name: str = attrib["name"]
+        # Interned: the name is used as key in the parent's _children and in the
+        # instance __dict__ of IDSStructure, interning lets lookups with attribute
+        # names (which Python interns as well) succeed on an identity check
+        self.name: str = sys.intern(attrib["name"])
         """Name of the IDS node, for example ``"comment"``."""
 
         # Context path: path relative to the nearest Array of Structures
@@ -215,26 +276,27 @@ class IDSMetadata:
             self.coordinates = ()
             self.coordinates_same_as = ()
         else:
-            # Parse coordinates
-            coors = [IDSCoordinate("")] * self.ndim
-            coors_same_as = [IDSCoordinate("")] * self.ndim
-            for dim in range(self.ndim):
-                coor = f"coordinate{dim + 1}"
-                if coor in attrib:
-                    coors[dim] = IDSCoordinate(attrib[coor])
-                    setattr(self, coor, coors[dim])
-                if coor + "_same_as" in attrib:
-                    coors_same_as[dim] = IDSCoordinate(attrib[coor + "_same_as"])
-                    setattr(self, coor + "_same_as", coors_same_as[dim])
-            self.coordinates = tuple(coors)
-            self.coordinates_same_as = tuple(coors_same_as)
+            # Parse coordinates, many DD nodes share the same coordinate attributes
+            coordinate_specs = tuple(
+                (attrib.get(coor), attrib.get(coor + "_same_as"))
+                for coor in _COORDINATE_ATTRIBUTES[: self.ndim]
+            )
+            coors, coors_same_as = _parse_coordinates(coordinate_specs)
+            for dim, (coor, coor_same_as) in enumerate(coordinate_specs):
+                attr_name = _COORDINATE_ATTRIBUTES[dim]
+                if coor is not None:
+                    setattr(self, attr_name, coors[dim])
+                if coor_same_as is not None:
+                    setattr(self, attr_name + "_same_as", coors_same_as[dim])
+            self.coordinates = coors
+            self.coordinates_same_as = coors_same_as
 
         # Parse alternative coordinates
         self.alternative_coordinates: "tuple[IDSPath]" = ()
         """Quantities that can be used as coordinate instead of this node."""
         if "alternative_coordinate1" in attrib:
-            self.alternative_coordinates = tuple(
-                IDSPath(coor) for coor in attrib["alternative_coordinate1"].split(";")
+            self.alternative_coordinates = _parse_alternative_coordinates(
+                attrib["alternative_coordinate1"]
             )
 
         # Store any remaining attributes from the DD XML
@@ -242,13 +304,25 @@ class IDSMetadata:
             if attr_name not in self.__dict__ and not attr_name.startswith("_"):
                 self.__dict__[attr_name] = attrib[attr_name]
 
-        # Cache children in a read-only dict
+        # Cache children in a read-only dict. Only <field> elements describe child
+        # nodes, iterfind lets ElementTree do the tag filtering in C.
         ctx_path = "" if self.data_type is IDSDataType.STRUCT_ARRAY else self._ctx_path
+        children = (
+            IDSMetadata(xml_child, ctx_path, self)
+            for xml_child in structure_xml.iterfind("field")
+        )
         self._children = types.MappingProxyType(
-            {
-                xml_child.get("name"): IDSMetadata(xml_child, ctx_path, self)
-                for xml_child in structure_xml
-            }
+            {child.name: child for child in children}
+        )
+
+        # Cache sorted child names (and their UTF-8 encoding) for
+        # IDSStructure._xxhash. ids_properties/version_put is excluded from the hash
+        # (some old DDs don't have version_put defined)
+        hash_children = sorted(self._children)
+        if self.name == "ids_properties" and "version_put" in self._children:
+            hash_children.remove("version_put")
+        self._hash_children: Tuple[Tuple[str, bytes], ...] = tuple(
+            (name, name.encode("UTF-8")) for name in hash_children
         )
 
         # Cache node type
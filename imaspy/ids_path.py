@@ -130,6 +130,7 @@ class IDSPath:
     """
 
     _cache: Dict[str, "IDSPath"] = {}
+    _init_done = False  # Set to True at the end of __init__
 
     def __new__(cls, path: str) -> "IDSPath":
         if path not in cls._cache:
@@ -137,7 +138,7 @@ class IDSPath:
         return cls._cache[path]
 
     def __init__(self, path: str) -> None:
-        if hasattr(self, "_init_done"):
+        if self._init_done:
             return  # Already initialized, __new__ returned from cache
         self._path = path
         self.parts, self.indices = _parse_path(path)
@@ -146,7 +147,7 @@ class IDSPath:
         self._init_done = True
 
     def __setattr__(self, name: str, value: Any):
-        if hasattr(self, "_init_done"):
+        if self._init_done:
             raise RuntimeError("Cannot set attribute: IDSPath is read-only.")
         super().__setattr__(name, value)
 
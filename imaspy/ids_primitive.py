@@ -6,7 +6,6 @@ import logging
 import math
 import operator
 import struct
-from copy import deepcopy
 from numbers import Complex, Integral, Number, Real
 from typing import Tuple
 
@@ -89,7 +88,14 @@ class IDSPrimitive(IDSBase):
         # note: if parent needs updating it is handled by the deepcopy of our parent
         # TODO: implement the statement on the previous line O_O
         copy = self.__class__(self._parent, self.metadata)
-        copy.__value = deepcopy(self.__value, memo)
+        # Copy the value directly instead of going through copy.deepcopy(): values
+        # are immutable (None, str, int, float, complex), a list of str or an ndarray
+        value = self.__value
+        if isinstance(value, np.ndarray):
+            value = value.copy(order="K")
+        elif isinstance(value, list):
+            value = list(value)
+        copy.__value = value
         return copy
 
     @property
@@ -322,10 +328,10 @@ class IDSString1D(IDSPrimitive):
         return [_cast_str(self, value)]
 
     def _xxhash(self) -> bytes:
-        hsh = xxh3_64(len(self).to_bytes(8, "little"))
-        for s in self:
-            hsh.update(xxh3_64_digest(s.encode("UTF-8")))
-        return hsh.digest()
+        # Hash the length and all string digests in one go
+        parts = [len(self).to_bytes(8, "little")]
+        parts.extend(xxh3_64_digest(s.encode("UTF-8")) for s in self)
+        return xxh3_64_digest(b"".join(parts))
 
 
 class IDSNumeric0D(IDSPrimitive):
@@ -492,7 +498,10 @@ class IDSNumericArray(IDSPrimitive, np.lib.mixins.NDArrayOperatorsMixin):
         hsh.update(struct.pack("<" + arr.ndim * "q", *arr.shape))
         # Ensure array is little endian, only create a copy if it is big-endian
         arr = arr.astype(arr.dtype.newbyteorder("little"), copy=False)
-        hsh.update(arr.tobytes(order="F"))
+        # Hash the data in Fortran order without creating an intermediate bytes
+        # object: the transpose of a Fortran-contiguous array is C-contiguous and can
+        # be passed to xxhash through the buffer protocol
+        hsh.update(np.asfortranarray(arr).T)
         return hsh.digest()
 
 
@@ -4,10 +4,9 @@
 """
 
 import logging
-from copy import deepcopy
 from typing import Optional, Tuple
 
-from xxhash import xxh3_64
+from xxhash import xxh3_64_digest
 
 from imaspy.backends.imas_core.al_context import LazyALArrayStructContext
 from imaspy.ids_base import IDSBase, IDSDoc
@@ -56,7 +55,7 @@ class IDSStructArray(IDSBase):
     def __deepcopy__(self, memo):
         copy = self.__class__(self._parent, self.metadata)
         for value in self.value:
-            value_copy = deepcopy(value, memo)
+            value_copy = value.__deepcopy__(memo)  # skip copy.deepcopy() dispatch
             value_copy._parent = copy
             copy.value.append(value_copy)
         return copy
@@ -227,7 +226,7 @@ class IDSStructArray(IDSBase):
                 child._validate()
 
     def _xxhash(self) -> bytes:
-        hsh = xxh3_64(len(self).to_bytes(8, "little"))
-        for s in self:
-            hsh.update(s._xxhash())
-        return hsh.digest()
+        # Hash the length and all element digests in one go
+        parts = [len(self).to_bytes(8, "little")]
+        parts.extend(s._xxhash() for s in self)
+        return xxh3_64_digest(b"".join(parts))
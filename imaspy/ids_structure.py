@@ -4,11 +4,11 @@
 """
 
 import logging
-from copy import deepcopy
+from functools import lru_cache
 from types import MappingProxyType
-from typing import Generator, List, Optional, Union
+from typing import Generator, List, Optional, Tuple, Union
 
-from xxhash import xxh3_64
+from xxhash import xxh3_64_digest
 
 from imaspy.backends.imas_core.al_context import LazyALContext
 from imaspy.ids_base import IDSBase, IDSDoc
@@ -21,6 +21,16 @@ from imaspy.ids_struct_array import IDSStructArray
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _structure_dir(cls: type, metadata: IDSMetadata) -> Tuple[str, ...]:
+    """Sorted attribute names of a structure with the given class and metadata.
+
+    The instance __dict__ only contains child nodes, so the result of ``__dir__`` is
+    fully determined by the class attributes and the child names in the metadata.
+    """
+    return tuple(sorted(set(dir(cls)).union(metadata._children)))
+
+
 class IDSStructure(IDSBase):
     """IDS structure node
 
@@ -31,6 +41,18 @@ class IDSStructure(IDSBase):
     """
 
     __doc__ = IDSDoc(__doc__)
+    # Fixed attributes are stored in slots. Child nodes are created on first access
+    # (see __getattr__) and stored in the instance __dict__. __weakref__ keeps
+    # structures (and IDS toplevels) weak-referenceable.
+    __slots__ = [
+        "_parent",
+        "_lazy",
+        "metadata",
+        "_children",
+        "_lazy_context",
+        "__dict__",
+        "__weakref__",
+    ]
     _children: "MappingProxyType[str, IDSMetadata]"
     _lazy_context: Optional[LazyALContext]
 
@@ -43,23 +65,24 @@ class IDSStructure(IDSBase):
             metadata: IDSMetadata describing the structure of the IDS
         """
         # Performance hack: bypass our __setattr__ implementation during __init__:
-        dct = self.__dict__
-        dct["_parent"] = parent
-        # parent._lazy is undefined for IDSToplevel, but then _lazy is already set
-        if "_lazy" not in dct:
-            dct["_lazy"] = parent._lazy
-        dct["metadata"] = metadata
+        set_slot = object.__setattr__
+        set_slot(self, "_parent", parent)
+        # parent._lazy is undefined for IDSToplevel (the only structure without
+        # parent metadata), but then _lazy is already set
+        if metadata._parent is not None:
+            set_slot(self, "_lazy", parent._lazy)
+        set_slot(self, "metadata", metadata)
 
-        dct["_children"] = metadata._children
-        dct["_lazy_context"] = None
+        set_slot(self, "_children", metadata._children)
+        set_slot(self, "_lazy_context", None)
 
     def __getattr__(self, name):
-        if name not in self._children:
+        child_meta = self._children.get(name)
+        if child_meta is None:
             raise AttributeError(
                 f"IDS structure '{self._path}' has no attribute '{name}'"
             )
-        # Create child node
-        child_meta = self._children[name]
+        # Create child node, the node type is resolved when building the metadata
         child = child_meta._node_type(self, child_meta)
         self.__dict__[name] = child  # bypass setattr logic below: avoid recursion
         if self._lazy:  # lazy load the child
@@ -107,10 +130,15 @@ class IDSStructure(IDSBase):
         if key.startswith("_"):
             return super().__setattr__(key, value)
 
-        # This will raise an attribute error when there is no child named 'key', fine?
-        attr = getattr(self, key)
+        attr = self.__dict__.get(key)
+        if attr is None:
+            # This will raise an attribute error when there is no child named 'key'
+            attr = getattr(self, key)
 
-        if isinstance(attr, IDSStructure):
+        # The node type is fully determined by the metadata: dispatch on the data
+        # type instead of walking the class hierarchy with isinstance
+        data_type = attr.metadata.data_type
+        if data_type is IDSDataType.STRUCTURE:
             if isinstance(value, (IDSIdentifier, str, int)):
                 return attr._assign_identifier(value)
 
@@ -126,7 +154,7 @@ class IDSStructure(IDSBase):
             super().__setattr__(key, value)
             value._parent = self
 
-        elif isinstance(attr, IDSStructArray):
+        elif data_type is IDSDataType.STRUCT_ARRAY:
             if not isinstance(value, IDSStructArray):
                 raise TypeError(
                     f"Trying to set struct array field {key} with non-struct-array."
@@ -148,14 +176,24 @@ class IDSStructure(IDSBase):
                 "deepcopy is not implemented for lazy-loaded IDSs."
             )
         copy = self.__class__(self._parent, self.metadata)
-        for child in self._children:
-            if child in self.__dict__:
-                child_copy = deepcopy(getattr(self, child), memo)
-                setattr(copy, child, child_copy)
+        # Only materialized children can contain data. Copy them directly into the
+        # __dict__ of the copy: going through setattr() would first create (and then
+        # discard) a new child node and run the type checks of our __setattr__.
+        # Loop over the materialized children only, so the cost of a copy scales with
+        # the number of nodes that were accessed and not with the size of the DD.
+        children = self._children
+        copy_dct = copy.__dict__
+        for child, child_node in self.__dict__.items():
+            if child in children:
+                # All IDS nodes implement __deepcopy__, call it without the dispatch
+                # overhead of copy.deepcopy()
+                child_copy = child_node.__deepcopy__(memo)
+                child_copy._parent = copy
+                copy_dct[child] = child_copy
         return copy
 
     def __dir__(self) -> List[str]:
-        return sorted(set(object.__dir__(self)).union(self._children))
+        return list(_structure_dir(type(self), self.metadata))
 
     def __eq__(self, other) -> bool:
         if self is other:
@@ -173,7 +211,7 @@ class IDSStructure(IDSBase):
 
         Set the context that we can use for retrieving our children.
         """
-        self._lazy_context = ctx
+        object.__setattr__(self, "_lazy_context", ctx)  # bypass our __setattr__
 
     @property
     def _dd_parent(self) -> IDSBase:
@@ -256,9 +294,12 @@ class IDSStructure(IDSBase):
                 "Code%20Documentation/IMASPy-doc/generated/imaspy.ids_structure."
                 "IDSStructure.html#imaspy.ids_structure.IDSStructure.iter_nonempty_"
             )
+        # Only children that were accessed before can have a value. These are cached
+        # in our __dict__ by __getattr__, so we can read them directly from there:
+        dct = self.__dict__
         for child in self._children:
-            if child in self.__dict__:
-                child_node = getattr(self, child)
+            child_node = dct.get(child)
+            if child_node is not None:
                 if (  # IDSStructure.has_value is not implemented when lazy-loaded:
                     self._lazy and isinstance(child_node, IDSStructure)
                 ) or child_node.has_value:
@@ -266,13 +307,18 @@ class IDSStructure(IDSBase):
 
     def __iter__(self):
         """Iterate over this structure's children"""
-        return iter(map(self.__getitem__, self._children))
+        dct = self.__dict__
+        for child in self._children:
+            # Materialized children are in our __dict__, only call __getattr__ for
+            # children that still need to be created
+            child_node = dct.get(child)
+            yield getattr(self, child) if child_node is None else child_node
 
     def __str__(self):
         return '%s("%s")' % (type(self).__name__, self.metadata.name)
 
     def __getitem__(self, key):
-        keyname = str(key)
+        keyname = key if type(key) is str else str(key)
         if keyname in self._children:
             return getattr(self, keyname)
 
@@ -286,7 +332,7 @@ class IDSStructure(IDSBase):
         return f"{self._build_repr_start()})>"
 
     def __setitem__(self, key, value):
-        keyname = str(key)
+        keyname = key if type(key) is str else str(key)
         if keyname in self._children:
             return self.__setattr__(keyname, value)
 
@@ -307,25 +353,56 @@ class IDSStructure(IDSBase):
         # Common validation logic
         super()._validate()
         # IDSStructure specific: validate child nodes
-        # accept_lazy=True: users are warned in IDSToplevel.validate()
-        for child in self.iter_nonempty_(accept_lazy=True):
-            child._validate()
+        # Loop in DD order, so the first reported error doesn't depend on the order in
+        # which children were accessed. Only materialized children (in our __dict__)
+        # can have a value, others are skipped without creating them.
+        # Child structures are validated without checking has_value here, validating
+        # an empty structure is a no-op. Note that IDSBase._validate still checks
+        # has_value of dynamic structures. Not checking it here also covers
+        # lazy-loaded structures, which don't implement has_value.
+        # Users are warned about lazy-loaded IDSs in IDSToplevel.validate().
+        dct = self.__dict__
+        for name in self._children:
+            child = dct.get(name)
+            if child is not None and (
+                isinstance(child, IDSStructure) or child.has_value
+            ):
+                child._validate()
 
     def _xxhash(self) -> bytes:
-        hsh = xxh3_64()
-        children = sorted(self._children)
-
-        # Skip ids_properties.version_put
-        if self.metadata.name == "ids_properties":
-            if "version_put" in children:  # Some old DDs don't have version_put defined
-                children.remove("version_put")
-
-        for childname in children:
-            child = self[childname]
-            if not child.has_value:
+        # Collect all data in a list and hash it in one go: this gives the same result
+        # as updating the hash for every part, with fewer calls into xxhash
+        return xxh3_64_digest(b"".join(self._xxhash_parts()))
+
+    def _xxhash_parts(self) -> List[bytes]:
+        """Collect the data to hash for this structure: child names and digests of all
+        children with a value."""
+        parts = []
+        dct = self.__dict__
+        # Sorted child names, without ids_properties.version_put
+        for childname, encoded_name in self.metadata._hash_children:
+            # Read materialized children directly from our __dict__: children that
+            # were never accessed have no value and don't need to be created. Only
+            # lazy-loaded structures need to load them from the backend.
+            child = dct.get(childname)
+            if child is None:
+                if not self._lazy:
+                    continue
+                child = getattr(self, childname)
+            if isinstance(child, IDSStructure):
+                # Recurse directly instead of first calling has_value, which walks the
+                # whole subtree again. An empty list of parts means there is nothing to
+                # hash, unless the only value is excluded (e.g. version_put)
+                child_parts = child._xxhash_parts()
+                if not child_parts and not child.has_value:
+                    continue
+                digest = xxh3_64_digest(b"".join(child_parts))
+            elif child.has_value:
+                digest = child._xxhash()
+            else:
                 continue
 
-            hsh.update(childname.encode("UTF-8"))
-            hsh.update(child._xxhash())
+            parts.append(encoded_name)
+            parts.append(digest)
 
-        return hsh.digest()
+        return parts
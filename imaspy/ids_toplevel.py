@@ -4,8 +4,10 @@
 """
 
 import logging
+import mmap
 import os
 import tempfile
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -38,11 +40,16 @@ _FLEXBUFFERS_URI = "imas:flexbuffers?path=/"
 logger = logging.getLogger(__name__)
 
 
+# Existence of /dev/shm doesn't change during the lifetime of the process: only check
+# it once instead of doing a stat() for every (de)serialization
+_DEFAULT_SERIALIZER_TMPDIR = "/dev/shm" if os.path.exists("/dev/shm") else "."
+
+
 def _serializer_tmpdir() -> str:
     env_tmpdir = os.getenv("IMAS_AL_SERIALIZER_TMP_DIR")
     if env_tmpdir:
         return env_tmpdir
-    return "/dev/shm" if os.path.exists("/dev/shm") else "."
+    return _DEFAULT_SERIALIZER_TMPDIR
 
 
 def _create_serialization_dbentry(filepath: str, dd_version: str) -> "DBEntry":
@@ -70,6 +77,8 @@ class IDSToplevel(IDSStructure):
     """
 
     __doc__ = IDSDoc(__doc__)
+    # All attributes, including __dict__ and __weakref__, come from IDSStructure
+    __slots__ = ()
     _path = ""  # Path to ourselves without the IDS name and slashes
 
     def __init__(self, parent: "IDSFactory", structure_xml, lazy=False):
@@ -80,7 +89,8 @@ class IDSToplevel(IDSStructure):
             structure_xml: XML structure that defines this IDS toplevel.
             lazy: Whether this toplevel is used for a lazy-loaded get() or get_slice()
         """
-        self._lazy = lazy
+        # Performance hack: bypass IDSStructure.__setattr__, like IDSStructure.__init__
+        object.__setattr__(self, "_lazy", lazy)
         # structure_xml might be an IDSMetadata already when initializing from __copy__
         # or __deepcopy__
         if isinstance(structure_xml, IDSMetadata):
@@ -154,18 +164,29 @@ class IDSToplevel(IDSStructure):
             raise ValueError("IDS is found to be EMPTY (homogeneous_time undefined)")
         if protocol == ASCII_SERIALIZER_PROTOCOL:
             tmpdir = _serializer_tmpdir()
-            filepath = tempfile.mktemp(prefix="al_serialize_", dir=tmpdir)
-            dbentry = _create_serialization_dbentry(filepath, dd_version)
-            dbentry.put(self)
-            dbentry.close()
-
+            # mkstemp securely creates a unique file, the backend will overwrite it
+            fd, filepath = tempfile.mkstemp(prefix="al_serialize_", dir=tmpdir)
+            os.close(fd)
             try:
-                # read contents of tmpfile
-                with open(filepath, "rb") as f:
-                    data = f.read()
+                dbentry = _create_serialization_dbentry(filepath, dd_version)
+                dbentry.put(self)
+                dbentry.close()
+
+                # Reopen tmpfile by name and map it: its contents are copied only
+                # once, straight into the result after the protocol byte
+                with open(filepath, "rb", buffering=0) as f:
+                    if os.fstat(f.fileno()).st_size == 0:  # cannot mmap empty files
+                        raise RuntimeError(
+                            "Serialization failed: "
+                            "the ASCII backend did not write any data."
+                        )
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = bytes([ASCII_SERIALIZER_PROTOCOL]) + mm
             finally:
-                os.unlink(filepath)  # remove tmpfile from disk
-            return bytes([ASCII_SERIALIZER_PROTOCOL]) + data
+                # remove tmpfile from disk, also when an error occurred
+                with suppress(FileNotFoundError):
+                    os.unlink(filepath)
+            return data
         if protocol == FLEXBUFFERS_SERIALIZER_PROTOCOL:
             # Note: FLEXBUFFERS_SERIALIZER_PROTOCOL is None when imas_core doesn't
             # support this format
@@ -193,18 +214,19 @@ class IDSToplevel(IDSStructure):
         dd_version = self._dd_version
         if protocol == ASCII_SERIALIZER_PROTOCOL:
             tmpdir = _serializer_tmpdir()
-            filepath = tempfile.mktemp(prefix="al_serialize_", dir=tmpdir)
+            fd, filepath = tempfile.mkstemp(prefix="al_serialize_", dir=tmpdir)
             # write data into tmpfile
             try:
-                with open(filepath, "wb") as f:
-                    f.write(data[1:])
+                with open(fd, "wb") as f:
+                    # memoryview slice: skip the protocol byte without copying data
+                    f.write(memoryview(data)[1:])
                 # Temporarily open an ASCII backend for deserialization from tmpfile
                 dbentry = _create_serialization_dbentry(filepath, dd_version)
                 dbentry.get(self.metadata.name, destination=self)
                 dbentry.close()
             finally:
-                # tmpfile may not exist depending if an error occurs in above code
-                if os.path.exists(filepath):
+                # remove tmpfile from disk, also when an error occurred
+                with suppress(FileNotFoundError):
                     os.unlink(filepath)
         elif protocol == FLEXBUFFERS_SERIALIZER_PROTOCOL:
             with imaspy.DBEntry(_FLEXBUFFERS_URI, "r", dd_version=dd_version) as entry:
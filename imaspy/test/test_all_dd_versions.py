@@ -1,6 +1,6 @@
 import pytest
 
-from imaspy import dd_zip, ids_metadata
+from imaspy import dd_zip, ids_factory, ids_metadata
 from imaspy.ids_factory import IDSFactory
 
 
@@ -9,9 +9,10 @@ def skip_object_caches(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(dd_zip, "_load_etree", dd_zip._load_etree.__wrapped__)
     monkeypatch.setattr(
         ids_metadata,
-        "get_toplevel_metadata",
-        ids_metadata.get_toplevel_metadata.__wrapped__,
+        "_get_toplevel_metadata",
+        ids_metadata._get_toplevel_metadata.__wrapped__,
     )
+    monkeypatch.setattr(ids_factory, "_ids_elements", ids_factory._build_ids_elements)
 
 
 @pytest.fixture(params=dd_zip.dd_xml_versions())
@@ -23,3 +23,19 @@ def test_deepcopy():
 
     validate_parent(cp)
     validate_parent(cp2)
+
+
+def test_deepcopy_primitive_values_are_independent():
+    cp = imaspy.IDSFactory("3.39.0").core_profiles()
+    cp.time = [1.0, 2.0, 3.0]
+    cp.ids_properties.comment = "test"
+    cp.ids_properties.provenance.node.resize(1)
+    cp.ids_properties.provenance.node[0].sources = ["a", "b"]
+
+    cp2 = copy.deepcopy(cp)
+    cp2.time[0] = 0.0
+    cp2.ids_properties.provenance.node[0].sources.append("c")
+
+    assert list(cp.time) == [1.0, 2.0, 3.0]
+    assert list(cp.ids_properties.provenance.node[0].sources) == ["a", "b"]
+    assert cp2.ids_properties.comment == "test"
@@ -1,5 +1,8 @@
+import gc
+
 import pytest
 
+from imaspy import dd_zip, ids_factory
 from imaspy.dd_zip import latest_dd_version
 from imaspy.ids_factory import IDSFactory
 
@@ -33,3 +36,14 @@ def test_ids_factory_from_env(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("IMAS_VERSION", version)
     factory = IDSFactory()
     assert factory._version == version
+
+
+def test_ids_elements_cache_does_not_keep_trees_alive(monkeypatch, ids_minimal):
+    monkeypatch.setattr(dd_zip, "_load_etree", dd_zip._load_etree.__wrapped__)
+    factory = IDSFactory(xml_path=ids_minimal)
+    etree = factory._etree
+    assert etree in ids_factory._ids_elements_cache
+    num_cached = len(ids_factory._ids_elements_cache)
+    del factory, etree
+    gc.collect()
+    assert len(ids_factory._ids_elements_cache) < num_cached
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 import pytest
 
+from imaspy.dd_zip import dd_xml_versions
 from imaspy.ids_factory import IDSFactory
 from imaspy.ids_metadata import IDSType, get_toplevel_metadata
 
@@ -12,6 +14,16 @@ def test_metadata_cache(fake_structure_xml):
     assert meta is meta2
 
 
+def test_metadata_concurrent_build(fake_structure_xml):
+    with ThreadPoolExecutor(8) as pool:
+        metas = list(pool.map(get_toplevel_metadata, [fake_structure_xml] * 8))
+    # All threads get the same, fully built metadata
+    assert all(meta is metas[0] for meta in metas)
+    assert metas[0].name == "gyrokinetics"
+    with pytest.raises(RuntimeError):
+        metas[0].immutable = True
+
+
 def test_metadata_init_structure_xml(fake_structure_xml):
     meta = get_toplevel_metadata(fake_structure_xml)
     assert fake_structure_xml.attrib["name"] == "gyrokinetics"
@@ -64,3 +76,23 @@ def test_metadata_indexing():
     # Test invalid path
     with pytest.raises(KeyError):
         metadata["DoesNotExist"]
+
+
+def test_metadata_shared_coordinates():
+    core_profiles = IDSFactory("3.39.0").core_profiles()
+    metadata = core_profiles.metadata
+    te = metadata["profiles_1d/electrons/temperature"]
+    ne = metadata["profiles_1d/electrons/density"]
+    assert te.coordinates is ne.coordinates
+    assert te.coordinate1 is te.coordinates[0]
+    assert str(te.coordinate1) == "profiles_1d(itime)/grid/rho_tor_norm"
+
+
+def test_metadata_shared_alternative_coordinates():
+    if "4.0.0" not in dd_xml_versions():
+        pytest.skip("Alternative coordinates are defined in DD 4.0.0")
+    factory = IDSFactory("4.0.0")
+    cp_rho = factory.core_profiles().metadata["profiles_1d/grid/rho_tor_norm"]
+    re_rho = factory.runaway_electrons().metadata["profiles_1d/grid/rho_tor_norm"]
+    assert cp_rho.alternative_coordinates
+    assert cp_rho.alternative_coordinates is re_rho.alternative_coordinates
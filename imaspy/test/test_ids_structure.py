@@ -2,6 +2,7 @@
 # You should have received the IMASPy LICENSE file with this project.
 import copy
 import pprint
+import weakref
 
 import pytest
 
@@ -68,3 +69,10 @@ def test_structure_eq():
     cp1.ids_properties.homogeneous_time = 1
     assert cp1 == cp2
     assert cp1.ids_properties == cp2.ids_properties
+
+
+def test_structure_weakref():
+    cp = IDSFactory().core_profiles()
+    for node in (cp, cp.ids_properties):
+        ref = weakref.ref(node)
+        assert ref() is node
@@ -3,10 +3,13 @@ constant-in-time DD
 """
 
 import pprint
+import weakref
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
+from imaspy.ids_defs import ASCII_SERIALIZER_PROTOCOL, IDS_TIME_MODE_INDEPENDENT
 from imaspy.ids_factory import IDSFactory
 from imaspy.ids_toplevel import IDSToplevel
 from imaspy.test.test_helpers import compare_children, fill_with_random_data
@@ -46,6 +49,11 @@ def test_pretty_print(ids):
     assert pprint.pformat(ids) == "<IDSToplevel (IDS:gyrokinetics)>"
 
 
+def test_toplevel_weakref(ids):
+    assert weakref.ref(ids)() is ids
+    assert "__weakref__" in dir(ids)
+
+
 def test_serialize_nondefault_dd_version():
     ids = IDSFactory("3.31.0").core_profiles()
     fill_with_random_data(ids)
@@ -53,3 +61,29 @@ def test_serialize_nondefault_dd_version():
     ids2 = IDSFactory("3.31.0").core_profiles()
     ids2.deserialize(data)
     compare_children(ids, ids2)
+
+
+def test_serialize_empty_backend_output(monkeypatch, requires_imas):
+    # Backend that doesn't write anything to the temporary file
+    monkeypatch.setattr(
+        "imaspy.ids_toplevel._create_serialization_dbentry", Mock(return_value=Mock())
+    )
+    ids = IDSFactory().core_profiles()
+    ids.ids_properties.homogeneous_time = IDS_TIME_MODE_INDEPENDENT
+    with pytest.raises(RuntimeError):
+        ids.serialize(ASCII_SERIALIZER_PROTOCOL)
+
+
+def test_serialize_reads_backend_output(monkeypatch, requires_imas):
+    def create_dbentry(filepath, dd_version):
+        with open(filepath, "w") as f:
+            f.write("serialized data")
+        return Mock()
+
+    monkeypatch.setattr(
+        "imaspy.ids_toplevel._create_serialization_dbentry", create_dbentry
+    )
+    ids = IDSFactory().core_profiles()
+    ids.ids_properties.homogeneous_time = IDS_TIME_MODE_INDEPENDENT
+    data = ids.serialize(ASCII_SERIALIZER_PROTOCOL)
+    assert data == bytes([ASCII_SERIALIZER_PROTOCOL]) + b"serialized data"
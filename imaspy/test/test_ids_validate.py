@@ -53,6 +53,22 @@ def test_validate_time_coordinate_homogeneous():
         cp.validate()
 
 
+def test_validate_error_order_independent_of_access():
+    for access_profiles_first in (True, False):
+        cp = IDSFactory("3.39.0").core_profiles()
+        cp.ids_properties.homogeneous_time = IDS_TIME_MODE_HOMOGENEOUS
+        cp.time = np.array([1.0, 2.0])
+        if access_profiles_first:
+            cp.profiles_1d.resize(3)
+            cp.global_quantities.ip = np.ones(3)
+        else:
+            cp.global_quantities.ip = np.ones(3)
+            cp.profiles_1d.resize(3)
+        # profiles_1d comes before global_quantities in the DD
+        with pytest.raises(ValidationError, match="profiles_1d"):
+            cp.validate()
+
+
 def test_validate_time_coordinate_heterogeneous_core_profiles():
     cp = IDSFactory("3.39.0").core_profiles()
     cp.ids_properties.homogeneous_time = IDS_TIME_MODE_HETEROGENEOUS